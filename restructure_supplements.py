@@ -3,34 +3,60 @@
 Restructure pcos_supplements.txt for optimal RAG retrieval with proper markdown headers
 """
 
+import os
 import re
 
-def restructure_supplement_file(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+# Patterns are compiled once at import time. They are applied as separate
+# passes because several of them can match across line breaks (the \s and
+# [^=] classes include newlines), so each pass can see the output of the
+# previous ones and a single fused alternation would rewrite differently.
+_H1_RE = re.compile(r'===\s*([^=]+)\s*===')
+_CAT_RE = re.compile(r'^CATEGORY ([IVX]+)[:|-]\s*([^\n]+)', re.MULTILINE)
+_SUP_RE = re.compile(r'^SUPPLEMENT:\s*([^\n]+)', re.MULTILINE)
+_H4_RE = re.compile(r'^([A-Z][A-Z\s]+):$', re.MULTILINE)
+_KV_RE = re.compile(r'^(Category|Evidence Level|Supplement Type):\s*', re.MULTILINE)
+# Removing a rule only empties its line, so the three rule styles share a pass
+_HR_RE = re.compile(r'^(?:---+|[═─]+)$', re.MULTILINE)
+_BLANK_RE = re.compile(r'\n{3,}')
+
+
+def restructure_content(content):
+    """Apply the markdown restructuring rewrites to ``content``."""
     # Replace === headers with # (H1)
-    content = re.sub(r'===\s*([^=]+)\s*===', r'# \1', content)
+    content = _H1_RE.sub(r'# \1', content)
     
     # Replace CATEGORY headers with ## (H2)
-    content = re.sub(r'^CATEGORY ([IVX]+)[:|-]\s*([^\n]+)', r'## CATEGORY \1 - \2', content, flags=re.MULTILINE)
+    content = _CAT_RE.sub(r'## CATEGORY \1 - \2', content)
     
     # Replace SUPPLEMENT: with ### (H3)
-    content = re.sub(r'^SUPPLEMENT:\s*([^\n]+)', r'### \1', content, flags=re.MULTILINE)
+    content = _SUP_RE.sub(r'### \1', content)
     
     # Replace standalone headers (ALL CAPS followed by colon) with #### (H4)
-    content = re.sub(r'^([A-Z][A-Z\s]+):$', r'#### \1', content, flags=re.MULTILINE)
+    content = _H4_RE.sub(r'#### \1', content)
     
     # Convert property-value pairs to bold
-    content = re.sub(r'^(Category|Evidence Level|Supplement Type):\s*', r'**\1:** ', content, flags=re.MULTILINE)
+    content = _KV_RE.sub(r'**\1:** ', content)
     
     # Remove redundant horizontal rules
-    content = re.sub(r'^---+$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'^═+$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'^─+$', '', content, flags=re.MULTILINE)
+    content = _HR_RE.sub('', content)
     
     # Clean up multiple blank lines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    return _BLANK_RE.sub('\n\n', content)
+
+
+def restructure_supplement_file(input_file, output_file):
+    # Skip the rewrite when the output is already newer than the input
+    try:
+        if os.stat(output_file).st_mtime >= os.stat(input_file).st_mtime:
+            print(f"✅ Already up to date: {output_file}")
+            return
+    except FileNotFoundError:
+        pass
+    
+    with open(input_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    content = restructure_content(content)
     
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -4,8 +4,10 @@ Split pcos_ingredient_substitutes_RAG.txt into 6 category-based files
 for better RAG retrieval precision and maintainability.
 """
 
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Define the input file
@@ -57,84 +59,87 @@ SECTION_MAPPING = {
     }
 }
 
+# Section headers (## SECTION X: ... / ## SECTION: KETOGENIC ...), as a bytes
+# pattern so it can scan the mmap'd source without decoding it
+_SECTION_HEADER_RE = re.compile(rb'^## SECTION(?: (\d+):|: KETOGENIC)', re.MULTILINE)
+
+# The unnumbered KETOGENIC section is stored as section 18
+_KETO_SECTION_NUM = 18
+
+# Highest section number any category file uses
+_MAX_SECTION_NUM = max(
+    [_KETO_SECTION_NUM]
+    + [num for category_info in SECTION_MAPPING.values() for num in category_info['sections']]
+)
+
+# Separator bar used around the body of each category file
+_BAR = "=" * 80
+
+# Fixed boilerplate around the sections of each category file
+_TEMPLATE_HEAD = (
+    "{title}\n"
+    "Version: 2025-11-11 (Split from main file)\n"
+    "Purpose: RAG file for LangChain embeddings - {category} category\n"
+    "Format: Ingredient → Substitute mapping with regional alternatives and diet-type considerations\n"
+    "Usage: Query by ingredient name, cooking method, or diet restriction to retrieve PCOS-friendly alternatives\n"
+    "\n"
+    + _BAR
+)
+_TEMPLATE_TAIL = "\n\n" + _BAR + "\nEND OF {title}\n" + _BAR
+
+# SECTION_MAPPING never changes at runtime, so render and encode each
+# category's head and tail once (category name -> (head, tail) as UTF-8 bytes)
+_RENDERED_TEMPLATES = {
+    category_name: (
+        _TEMPLATE_HEAD.format(title=category_info['title'], category=category_name.upper()).encode('utf-8'),
+        _TEMPLATE_TAIL.format(title=category_info['title']).encode('utf-8'),
+    )
+    for category_name, category_info in SECTION_MAPPING.items()
+}
+
 
 def parse_sections(content):
-    """Parse the file and extract sections with their numbers."""
-    sections = {}
-    current_section_num = None
-    current_section_content = []
-    
-    lines = content.split('\n')
-    header_lines = []  # Store the file header (before first section)
-    in_header = True
-    
-    for line in lines:
-        # Check for section header (## SECTION X: ... ###)
-        section_match = re.match(r'^## SECTION (\d+):', line)
-        keto_match = re.match(r'^## SECTION: KETOGENIC', line)
-        
-        if section_match:
-            # Save previous section
-            if current_section_num is not None:
-                sections[current_section_num] = '\n'.join(current_section_content)
-            
-            # Start new section
-            current_section_num = int(section_match.group(1))
-            current_section_content = [line]
-            in_header = False
-            
-        elif keto_match:
-            # Save previous section
-            if current_section_num is not None:
-                sections[current_section_num] = '\n'.join(current_section_content)
-            
-            # Keto is section 18
-            current_section_num = 18
-            current_section_content = [line]
-            in_header = False
-            
-        else:
-            if in_header:
-                header_lines.append(line)
-            elif current_section_num is not None:
-                current_section_content.append(line)
-    
-    # Save last section
-    if current_section_num is not None:
-        sections[current_section_num] = '\n'.join(current_section_content)
-    
-    # Get the header (everything before first section)
-    header = '\n'.join(header_lines).strip()
-    
-    return header, sections
-
-
-def create_file_content(category_name, category_info, header, sections):
-    """Create content for a category file."""
-    content_parts = []
-    
-    # Custom header for this category
-    content_parts.append(category_info['title'])
-    content_parts.append("Version: 2025-11-11 (Split from main file)")
-    content_parts.append("Purpose: RAG file for LangChain embeddings - " + category_name.upper() + " category")
-    content_parts.append("Format: Ingredient → Substitute mapping with regional alternatives and diet-type considerations")
-    content_parts.append("Usage: Query by ingredient name, cooking method, or diet restriction to retrieve PCOS-friendly alternatives")
-    content_parts.append("")
-    content_parts.append("=" * 80)
-    
-    # Add relevant sections
+    """Return the sections as a list indexed by number, plus skipped out-of-range numbers."""
+    # One regex scan over the bytes/mmap source finds every header, so the
+    # file is never decoded. Each entry is (section number, start offset).
+    section_starts = [
+        (int(match.group(1)) if match.group(1) else _KETO_SECTION_NUM, match.start())
+        for match in _SECTION_HEADER_RE.finditer(content)
+    ]
+    
+    # Size the list to the mapped range, not to whatever numbers the file holds;
+    # None marks a section number that is not present
+    sections = [None] * (_MAX_SECTION_NUM + 1)
+    skipped = set()
+    
+    # A section runs up to the newline before the next header and is sliced
+    # straight out of the source as bytes
+    section_ends = [start - 1 for _, start in section_starts[1:]] + [len(content)]
+    for (section_num, start), end in zip(section_starts, section_ends):
+        if section_num > _MAX_SECTION_NUM:
+            skipped.add(section_num)
+            continue
+        sections[section_num] = content[start:end]
+    
+    return sections, sorted(skipped)
+
+
+def write_file_content(output_file, category_name, category_info, sections):
+    """Write a category file and return its line count."""
+    head, tail = _RENDERED_TEMPLATES[category_name]
+    buf = bytearray(head)
+    
+    # Add relevant sections, each preceded by a blank line
     for section_num in category_info['sections']:
-        if section_num in sections:
-            content_parts.append("")
-            content_parts.append(sections[section_num])
+        section = sections[section_num]
+        if section is not None:
+            buf += b'\n\n'
+            buf += section
     
-    # Add end marker
-    content_parts.append("")
-    content_parts.append("=" * 80)
-    content_parts.append(f"END OF {category_info['title']}")
-    content_parts.append("=" * 80)
+    buf += tail
+    output_file.write_bytes(buf)
     
-    return '\n'.join(content_parts)
+    return buf.count(b'\n') + 1
 
 
 def main():
@@ -142,41 +147,54 @@ def main():
     print("🔪 Splitting PCOS Ingredient Substitutes file into 6 category-based files...")
     print()
     
-    # Read input file
+    # Check that the input file exists
     input_path = Path(INPUT_FILE)
     if not input_path.exists():
         print(f"❌ Error: Input file not found: {INPUT_FILE}")
         return
     
-    print(f"📖 Reading input file: {INPUT_FILE}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Skip the split when every category file is already newer than the input
+    output_dir = Path(OUTPUT_DIR)
+    input_stat = input_path.stat()
+    input_mtime = input_stat.st_mtime
+    output_files = [output_dir / category_info['file'] for category_info in SECTION_MAPPING.values()]
+    if all(f.exists() and f.stat().st_mtime >= input_mtime for f in output_files):
+        print("✅ Category files are already up to date, nothing to split.")
+        return
     
-    # Parse sections
+    # Map the input file and parse sections directly from the mapping
+    print(f"📖 Reading input file: {INPUT_FILE}")
     print("🔍 Parsing sections...")
-    header, sections = parse_sections(content)
-    print(f"   Found {len(sections)} sections")
-    print(f"   Section numbers: {sorted(sections.keys())}")
+    if input_stat.st_size == 0:
+        # mmap cannot map an empty file; an empty source still yields the
+        # boilerplate-only category files
+        sections, skipped = parse_sections(b'')
+    else:
+        with open(input_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sections, skipped = parse_sections(mm)
+    section_numbers = [num for num, text in enumerate(sections) if text is not None] + skipped
+    print(f"   Found {len(section_numbers)} sections")
+    print(f"   Section numbers: {section_numbers}")
+    for section_num in skipped:
+        print(f"   ⚠️  Skipping section {section_num}: not used by any category file")
     print()
     
     # Create output directory if needed
-    output_dir = Path(OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create each category file
+    # Write files concurrently (they are independent of each other)
+    with ThreadPoolExecutor(max_workers=len(output_files)) as executor:
+        line_counts = list(executor.map(
+            write_file_content,
+            output_files,
+            SECTION_MAPPING.keys(),
+            SECTION_MAPPING.values(),
+            [sections] * len(output_files),
+        ))
+    
+    # Report in mapping order so the log stays deterministic
     print("✂️  Creating category files:")
-    for category_name, category_info in SECTION_MAPPING.items():
-        output_file = output_dir / category_info['file']
-        
-        # Generate content
-        file_content = create_file_content(category_name, category_info, header, sections)
-        
-        # Write file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(file_content)
-        
-        # Count lines
-        line_count = len(file_content.split('\n'))
+    for category_info, line_count in zip(SECTION_MAPPING.values(), line_counts):
         section_nums = ', '.join(str(s) for s in category_info['sections'])
         
         print(f"   ✅ {category_info['file']}")
@@ -3,14 +3,43 @@
 Split pcos_supplements.txt into category-based files for optimal RAG ingestion
 """
 
+import mmap
 import re
+from pathlib import Path
+
+# Byte pattern, so the regex can run directly against the mmap'd file
+_CATEGORY_SPLIT_RE = re.compile(rb'(## CATEGORY [IVX]+ - [^\n]+)')
+
+def _category_output_file(parent, category_header):
+    """Return the output path for a "## CATEGORY <num> - <title>" header."""
+    # The split pattern guarantees the header shape, so no second regex is needed
+    cat_num = category_header.split(b' ', 3)[2].decode('ascii').lower()
+    return parent / f'pcos_supplements_category_{cat_num}.txt'
 
 def split_supplement_file(input_file):
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    in_path = Path(input_file)
+    parent = in_path.parent
+    input_stat = in_path.stat()
+    
+    # An empty file has no categories to write (and mmap cannot map it)
+    if input_stat.st_size == 0:
+        return
     
-    # Split by main categories (## CATEGORY)
-    sections = re.split(r'(## CATEGORY [IVX]+ - [^\n]+)', content)
+    with open(in_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Skip the split only when every category file this input defines exists
+        # and is newer than the input. The header scan does not copy the content.
+        output_files = [
+            _category_output_file(parent, match.group(1))
+            for match in _CATEGORY_SPLIT_RE.finditer(mm)
+        ]
+        if output_files and all(
+            out.exists() and out.stat().st_mtime >= input_stat.st_mtime for out in output_files
+        ):
+            print(f"✅ Category files already up to date in: {parent}")
+            return
+        
+        # Split by main categories (## CATEGORY), scanning the mapped file as bytes
+        sections = _CATEGORY_SPLIT_RE.split(mm)
     
     # Get header and disclaimers (everything before first CATEGORY)
     header = sections[0]
@@ -21,22 +50,14 @@ def split_supplement_file(input_file):
             category_header = sections[i]
             category_content = sections[i + 1]
             
-            # Extract category number from header
-            match = re.search(r'CATEGORY ([IVX]+)', category_header)
-            if match:
-                cat_num = match.group(1).lower()
-                
-                # Create file for this category
-                output_file = input_file.replace('pcos_supplements.txt', f'pcos_supplements_category_{cat_num}.txt')
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(header)
-                    f.write('\n\n')
-                    f.write(category_header)
-                    f.write('\n\n')
-                    f.write(category_content.strip())
-                
-                print(f"✅ Created: {output_file}")
+            # Create file for this category
+            output_file = _category_output_file(parent, category_header)
+            
+            output_file.write_bytes(
+                header + b'\n\n' + category_header + b'\n\n' + category_content.strip()
+            )
+            
+            print(f"✅ Created: {output_file}")
 
 if __name__ == "__main__":
     input_file = "/Users/supriya97/Desktop/AI Projects/sakhee/server/src/data/medical/pcos_supplements.txt"
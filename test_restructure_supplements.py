@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Check restructure_supplements against the original sequential re.sub chain.
+
+Run with: python3 -m unittest test_restructure_supplements
+"""
+
+import random
+import re
+import unittest
+
+from restructure_supplements import restructure_content
+
+
+def _sequential_reference(content):
+    """The original eight-pass rewrite, kept verbatim as the reference."""
+    content = re.sub(r'===\s*([^=]+)\s*===', r'# \1', content)
+    content = re.sub(r'^CATEGORY ([IVX]+)[:|-]\s*([^\n]+)', r'## CATEGORY \1 - \2', content, flags=re.MULTILINE)
+    content = re.sub(r'^SUPPLEMENT:\s*([^\n]+)', r'### \1', content, flags=re.MULTILINE)
+    content = re.sub(r'^([A-Z][A-Z\s]+):$', r'#### \1', content, flags=re.MULTILINE)
+    content = re.sub(r'^(Category|Evidence Level|Supplement Type):\s*', r'**\1:** ', content, flags=re.MULTILINE)
+    content = re.sub(r'^---+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'^═+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'^─+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n{3,}', '\n\n', content)
+    return content
+
+
+# Building blocks for generated inputs, including the awkward cases where a
+# pattern runs across a line break into the next line
+_LINES = [
+    "=" * 80,
+    "=== PCOS SUPPLEMENT GUIDE ===",
+    "CATEGORY I: Clinically Proven",
+    "CATEGORY II - Emerging Support",
+    "CATEGORY I:",
+    "CATEGORY I: Foo === bar ===",
+    "SUPPLEMENT: Vitamin D",
+    "SUPPLEMENT:",
+    "TARGET SYMPTOMS:",
+    "HOW IT",
+    "HELPS:",
+    "Category: Clinically Proven",
+    "Category:",
+    "Evidence Level:  Strong",
+    "Supplement Type: Vitamin",
+    "BEST FOR: Insulin resistance",
+    "---",
+    "-",
+    "--",
+    "═" * 40,
+    "─" * 40,
+    "",
+    "Plain text line.",
+]
+
+
+class RestructureContentTest(unittest.TestCase):
+    def assertMatchesReference(self, content):
+        self.assertEqual(restructure_content(content), _sequential_reference(content))
+
+    def test_bar_framed_guide(self):
+        content = "\n".join([
+            "=" * 80,
+            "PCOS SUPPLEMENT GUIDE",
+            "=" * 80,
+            "",
+            "CATEGORY I: Clinically Proven",
+            "",
+            "SUPPLEMENT: Vitamin D",
+            "Category: Clinically Proven",
+            "Evidence Level: Strong",
+            "",
+            "TARGET SYMPTOMS:",
+            "Low vitamin D levels.",
+            "---",
+            "",
+            "=" * 80,
+            "END OF GUIDE",
+            "=" * 80,
+            "",
+        ])
+        self.assertMatchesReference(content)
+
+    def test_h1_inside_category_line(self):
+        self.assertMatchesReference("CATEGORY I: Foo === bar ===\n")
+
+    def test_generated_inputs(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            content = "\n".join(rng.choice(_LINES) for _ in range(rng.randint(0, 12)))
+            if rng.random() < 0.5:
+                content += "\n"
+            with self.subTest(content=content):
+                self.assertMatchesReference(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Check split_ingredient_substitutes against the original line-based parser and writer.
+
+Run with: python3 -m unittest test_split_ingredient_substitutes
+"""
+
+import mmap
+import random
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from split_ingredient_substitutes import (
+    SECTION_MAPPING,
+    _MAX_SECTION_NUM,
+    parse_sections,
+    write_file_content,
+)
+
+
+def _baseline_parse_sections(content):
+    """The original line-based parser, kept verbatim as the reference."""
+    sections = {}
+    current_section_num = None
+    current_section_content = []
+
+    lines = content.split('\n')
+    header_lines = []
+    in_header = True
+
+    for line in lines:
+        section_match = re.match(r'^## SECTION (\d+):', line)
+        keto_match = re.match(r'^## SECTION: KETOGENIC', line)
+
+        if section_match:
+            if current_section_num is not None:
+                sections[current_section_num] = '\n'.join(current_section_content)
+            current_section_num = int(section_match.group(1))
+            current_section_content = [line]
+            in_header = False
+        elif keto_match:
+            if current_section_num is not None:
+                sections[current_section_num] = '\n'.join(current_section_content)
+            current_section_num = 18
+            current_section_content = [line]
+            in_header = False
+        else:
+            if in_header:
+                header_lines.append(line)
+            elif current_section_num is not None:
+                current_section_content.append(line)
+
+    if current_section_num is not None:
+        sections[current_section_num] = '\n'.join(current_section_content)
+
+    header = '\n'.join(header_lines).strip()
+
+    return header, sections
+
+
+def _baseline_create_file_content(category_name, category_info, header, sections):
+    """The original list-append writer, kept verbatim as the reference."""
+    content_parts = []
+
+    content_parts.append(category_info['title'])
+    content_parts.append("Version: 2025-11-11 (Split from main file)")
+    content_parts.append("Purpose: RAG file for LangChain embeddings - " + category_name.upper() + " category")
+    content_parts.append("Format: Ingredient → Substitute mapping with regional alternatives and diet-type considerations")
+    content_parts.append("Usage: Query by ingredient name, cooking method, or diet restriction to retrieve PCOS-friendly alternatives")
+    content_parts.append("")
+    content_parts.append("=" * 80)
+
+    for section_num in category_info['sections']:
+        if section_num in sections:
+            content_parts.append("")
+            content_parts.append(sections[section_num])
+
+    content_parts.append("")
+    content_parts.append("=" * 80)
+    content_parts.append(f"END OF {category_info['title']}")
+    content_parts.append("=" * 80)
+
+    return '\n'.join(content_parts)
+
+
+# Building blocks for generated inputs: mapped, duplicate, KETOGENIC and
+# out-of-range headers, plus lines that must not be taken for headers
+_LINES = [
+    "## SECTION 1: GRAINS & FLOURS",
+    "## SECTION 3: SWEETENERS & SUGARS",
+    "## SECTION 1: GRAINS (duplicate)",
+    "## SECTION 11: REGIONAL SPECIALTIES",
+    "## SECTION 17: ANIMAL PROTEIN SUBSTITUTES",
+    "## SECTION: KETOGENIC DIET SUBSTITUTES",
+    "## SECTION 19: NOT MAPPED",
+    "## SECTION 100000: MISTYPED",
+    "## SECTION two: NOT A NUMBER",
+    " ## SECTION 2: INDENTED",
+    "## SECTIONS",
+    "Maida → Ragi flour (North/South Indian)",
+    "Sugar → Jaggery in moderation",
+    "",
+]
+
+
+class SplitIngredientSubstitutesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _parse_file(self, content):
+        """Parse ``content`` the way main does: mmap'd, or as b'' when empty."""
+        data = content.encode('utf-8')
+        if not data:
+            return parse_sections(b'')
+        source = self.tmp_dir / 'source.txt'
+        source.write_bytes(data)
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_sections(mm)
+
+    def assertMatchesBaseline(self, content):
+        sections, skipped = self._parse_file(content)
+        header, baseline_sections = _baseline_parse_sections(content)
+
+        self.assertEqual(
+            {num: text.decode('utf-8') for num, text in enumerate(sections) if text is not None},
+            {num: text for num, text in baseline_sections.items() if num <= _MAX_SECTION_NUM},
+        )
+        self.assertEqual(skipped, sorted(num for num in baseline_sections if num > _MAX_SECTION_NUM))
+
+        for category_name, category_info in SECTION_MAPPING.items():
+            expected = _baseline_create_file_content(category_name, category_info, header, baseline_sections)
+            output_file = self.tmp_dir / category_info['file']
+            line_count = write_file_content(output_file, category_name, category_info, sections)
+            self.assertEqual(output_file.read_bytes(), expected.encode('utf-8'))
+            self.assertEqual(line_count, len(expected.split('\n')))
+
+    def test_empty_source(self):
+        self.assertMatchesBaseline("")
+
+    def test_source_without_section_headers(self):
+        self.assertMatchesBaseline("hello\nno sections\n")
+
+    def test_generated_inputs(self):
+        rng = random.Random(0)
+        for _ in range(3000):
+            content = "\n".join(rng.choice(_LINES) for _ in range(rng.randint(0, 12)))
+            if rng.random() < 0.5:
+                content += "\n"
+            with self.subTest(content=content):
+                self.assertMatchesBaseline(content)
+
+
+if __name__ == "__main__":
+    unittest.main()